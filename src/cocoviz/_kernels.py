@@ -0,0 +1,108 @@
+"""Low level numerical kernels used by the data structures in cocoviz"""
+
+import numpy as np
+import numpy.typing as npt
+
+
+def target_runtimes(
+    ivals: npt.ArrayLike,
+    fvals: npt.ArrayLike,
+    targets: npt.ArrayLike,
+    larger_is_better: bool,
+    out: tuple[np.ndarray, np.ndarray] | None = None,
+) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.bool_]]:
+    """Find the number of function evaluations needed to reach each target.
+
+    Parameters
+    ----------
+    ivals : array_like
+        Monotone indicator values, i.e. cumulative maximum if `larger_is_better`
+        and cumulative minimum otherwise. Must not contain NaN values.
+    fvals : array_like
+        Number of function evaluations corresponding to `ivals`.
+    targets : array_like
+        Target values of the indicator.
+    larger_is_better : bool
+        True if larger values of the indicator are better, False otherwise.
+    out : (ndarray, ndarray), optional
+        Float64 and bool arrays with one element per target to write the
+        results into. If missing, new arrays are allocated.
+
+    Returns
+    -------
+    (ndarray, ndarray)
+        Number of function evaluations at which each target was reached and
+        whether the target was hit. For missed targets, the last number of
+        function evaluations is returned.
+
+    Raises
+    ------
+    ValueError
+        If `ivals` is empty.
+    """
+    ivals = np.ascontiguousarray(ivals, dtype=np.float64)
+    fvals = np.ascontiguousarray(fvals, dtype=np.float64)
+    targets = np.ascontiguousarray(targets, dtype=np.float64)
+    if len(ivals) == 0:
+        raise ValueError("Cannot find target runtimes without any function evaluations.")
+
+    if out is None:
+        out = (np.empty(len(targets)), np.empty(len(targets), dtype=np.bool_))
+    target_fvals, target_hit = out
+
+    # Binary search per target. For minimized indicators, negate both indicator
+    # values and targets so that a single ascending search covers both cases.
+    if not larger_is_better:
+        ivals, targets = np.negative(ivals), np.negative(targets)
+    idx = np.searchsorted(ivals, targets, side="left")
+    target_hit[:] = idx < len(ivals)
+    # Missed targets have `idx == len(ivals)`, so clipping the index maps them
+    # to the last number of function evaluations without a separate branch.
+    np.take(fvals, np.minimum(idx, len(fvals) - 1), out=target_fvals)
+    return target_fvals, target_hit
+
+
+def kaplan_meier(
+    uncensored: npt.ArrayLike, right_censored: npt.ArrayLike
+) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+    """Kaplan-Meier estimate of the empirical CDF of right-censored data.
+
+    The result matches ``scipy.stats.ecdf(CensoredData(uncensored, right=right_censored)).cdf``.
+
+    Parameters
+    ----------
+    uncensored : array_like
+        Observed runtimes, i.e. runtimes of targets that were hit.
+    right_censored : array_like
+        Lower bounds on the runtimes of targets that were not hit.
+
+    Returns
+    -------
+    (ndarray, ndarray)
+        Unique runtimes (quantiles) and the estimated probability that the
+        runtime is at most the corresponding quantile.
+    """
+    uncensored = np.asarray(uncensored, dtype=np.float64)
+    right_censored = np.asarray(right_censored, dtype=np.float64)
+
+    # Without censoring, this reduces to the plain ECDF
+    if right_censored.size == 0:
+        times, counts = np.unique(uncensored, return_counts=True)
+        return times, np.cumsum(counts) / uncensored.size
+
+    # If no target was hit, the estimate is zero everywhere
+    if uncensored.size == 0:
+        times = np.unique(right_censored)
+        return times, np.zeros(times.size)
+
+    times = np.concatenate((uncensored, right_censored))
+    hit = np.concatenate((np.ones(uncensored.size), np.zeros(right_censored.size)))
+    order = np.argsort(times, kind="stable")
+    times, hit = times[order], hit[order]
+
+    # Number at risk and number of hits at each unique runtime
+    first = np.flatnonzero(np.diff(times, prepend=-np.inf) > 0)
+    at_risk = times.size - first
+    hits = np.add.reduceat(hit, first)
+
+    return times[first], 1 - np.cumprod((at_risk - hits) / at_risk)
@@ -5,24 +5,35 @@ from __future__ import annotations
 import dataclasses
 import json
 import logging
-from typing import Any, Generator, Union, Callable, Iterator
+from typing import Any, Generator, Union, Callable, Iterable, Iterator
 from collections.abc import Sequence
 
 import numpy as np
-import numpy.typing as npt
 
 import polars as pl
-from polars.exceptions import ColumnNotFoundError, SchemaFieldNotFoundError
 
 from . import indicator as ind
+from ._kernels import target_runtimes
 from ._typing import FilePath
 from .exceptions import NoSuchIndicatorException, IndicatorMismatchException
 
 logger = logging.getLogger(__name__)
 
+# Columns of a results frame that do not hold indicator values
+_FEVALS_COLUMNS = frozenset({"__fevals", "__fevals_dim"})
 
-@dataclasses.dataclass(eq=True, order=True, frozen=True)
-class ProblemDescription:
+
+@dataclasses.dataclass(eq=True, order=True, frozen=True, slots=True)
+class _ProblemFields:
+    """Fields of a `ProblemDescription`"""
+
+    name: str
+    instance: str
+    number_of_variables: int = 0
+    number_of_objectives: int = 0
+
+
+class ProblemDescription(_ProblemFields):
     """Description of a specific (benchmark) problem
 
     Attributes
@@ -38,12 +49,27 @@ class ProblemDescription:
         Return a JSON document describing the problem
     from_json(json)
         Create a ProblemDescription from a JSON document
+    get(name, instance, number_of_variables, number_of_objectives)
+        Return the shared ProblemDescription of a problem
     """
 
-    name: str
-    instance: str
-    number_of_variables: int = 0
-    number_of_objectives: int = 0
+    # Problem descriptions are used as keys throughout, so their hash is cached.
+    # It is stored in a slot of this subclass rather than in a field, so that
+    # `dataclasses.fields`, `asdict` and `astuple` only see the description.
+    __slots__ = ("_hash",)
+
+    def __hash__(self) -> int:
+        try:
+            return self._hash
+        except AttributeError:
+            pass
+        fields = (self.name, self.instance, self.number_of_variables, self.number_of_objectives)
+        object.__setattr__(self, "_hash", hash(fields))
+        return self._hash
+
+    def __reduce__(self):
+        # String hashes differ between processes, so recompute the hash on unpickling
+        return (self.__class__, (self.name, self.instance, self.number_of_variables, self.number_of_objectives))
 
     def __str__(self) -> str:
         return f"Instance {self.instance} of problem {self.name} with {self.number_of_variables} variables and {self.number_of_objectives} objectives"
@@ -56,7 +82,12 @@ class ProblemDescription:
         str
             JSON document describing the problem.
         """
-        raw = dataclasses.asdict(self)
+        raw = {
+            "name": self.name,
+            "instance": self.instance,
+            "number_of_variables": self.number_of_variables,
+            "number_of_objectives": self.number_of_objectives,
+        }
         return json.dumps(raw)
 
     @classmethod
@@ -73,12 +104,47 @@ class ProblemDescription:
         ProblemDescription
         """
         raw = json.loads(str)
-        return cls(**raw)
+        return cls.get(**raw)
+
+    @classmethod
+    def get(
+        cls, name: str, instance: str, number_of_variables: int = 0, number_of_objectives: int = 0
+    ) -> ProblemDescription:
+        """Return the shared ProblemDescription of a problem.
+
+        Equal problem descriptions obtained through `get` are the same object.
+        Results of many algorithms on the same problem then share one
+        description, and dictionary lookups succeed on identity.
+
+        Parameters
+        ----------
+        name : str
+        instance : str
+        number_of_variables : int
+        number_of_objectives : int
+
+        Returns
+        -------
+        ProblemDescription
+        """
+        key = (cls, name, instance, number_of_variables, number_of_objectives)
+        try:
+            return _problem_descriptions[key]
+        except KeyError:
+            pass
+        return _problem_descriptions.setdefault(key, cls(name, instance, number_of_variables, number_of_objectives))
+
+
+# Interned problem descriptions, see `ProblemDescription.get`. The number of
+# distinct problems is bounded by the benchmark suites, so entries are kept.
+_problem_descriptions = {}
 
 
 class Result:
     """Results of a single algorithms run on a single problem"""
 
+    __slots__ = ("algorithm", "problem", "indicators", "_data", "_fevals_np", "_fevals_dim_np", "_monotone")
+
     def __init__(
         self,
         algorithm: str,
@@ -93,23 +159,45 @@ class Result:
 
         if fevals_column != "__fevals":
             # Rename `fevals_column` to '__fevals', if not present guess and warn.
-            try:
-                data = data.rename({fevals_column: "__fevals"})
-            except (ColumnNotFoundError, SchemaFieldNotFoundError):
+            if fevals_column not in data.columns:
                 logger.warning(
                     f"Assuming first column ('{data.columns[0]}') contains the number of function evaluations."
                 )
-                data = data.rename({data.columns[0]: "__fevals"})
+                fevals_column = data.columns[0]
+            data = data.rename({fevals_column: "__fevals"})
 
-        # Sort data by '__fevals' column
-        data = data.sort("__fevals")
+        # Sort data by '__fevals' column. Results are usually logged in order of
+        # evaluation, so check first to skip the sort in the common case.
+        if not data["__fevals"].is_sorted():
+            data = data.sort("__fevals")
 
         # Pre-compute fevals / dim as '__fevals_dim'
-        self._data = data.with_columns((pl.col("__fevals") / problem.number_of_variables).alias("__fevals_dim"))
+        self._set_data(data.with_columns((pl.col("__fevals") / problem.number_of_variables).alias("__fevals_dim")))
+
+    @classmethod
+    def _from_canonical(cls, algorithm: str, problem: ProblemDescription, data: pl.DataFrame) -> Result:
+        """Create a Result from a frame that is sorted by '__fevals' and contains '__fevals_dim'"""
+        self = cls.__new__(cls)
+        self.algorithm = algorithm
+        self.problem = problem
+        self._set_data(data)
+        return self
+
+    def _set_data(self, data: pl.DataFrame):
+        self._data = data
+
+        # NumPy views of the fevals columns for the target search. `to_numpy`
+        # does not copy as long as the columns are contiguous and null-free.
+        self._fevals_np = self._data["__fevals"].to_numpy()
+        self._fevals_dim_np = self._data["__fevals_dim"].to_numpy()
 
         # All columns excluding '__fevals' and '__fevals_dim' are assumed to
-        # contain indicator values.
-        self.indicators = set(self._data.columns) - {"__fevals", "__fevals_dim"}
+        # contain indicator values. The set is immutable so that it can be
+        # shared and compared without copying; `__setitem__` replaces it.
+        self.indicators = frozenset(self._data.columns) - _FEVALS_COLUMNS
+
+        # Monotone (cumulative best) indicator values, computed on first use
+        self._monotone = {}
 
     def __getitem__(self, key: str) -> Any:
         if key not in self.indicators:
@@ -117,8 +205,11 @@ class Result:
         return self._data[key]
 
     def __setitem__(self, key: str, item):
-        self._data[key] = item
-        self.indicators.add(key)
+        if not isinstance(item, pl.Series):
+            item = pl.Series(key, item)
+        self._data = self._data.with_columns(item.alias(key))
+        self.indicators = self.indicators | {key}
+        self._monotone = {k: v for k, v in self._monotone.items() if k[0] != key}
 
     def __str__(self) -> str:
         return f"Results for {self.algorithm} on instance {self.problem.instance} of {self.problem.name} in {self.problem.number_of_variables} dimensions with {self.problem.number_of_objectives} objectives"
@@ -129,51 +220,59 @@ class Result:
     def __len__(self) -> int:
         return self._data.height
 
-    def at_indicator(self, indicator: Union[ind.Indicator, str], targets):
-        indicator = ind.resolve(indicator)
-
-        # FIXME: Assumes maximization of indicator...
+    def _monotone_indicator(self, indicator: ind.Indicator) -> np.ndarray:
+        """Return the cumulative best values of `indicator`, memoized per indicator"""
+        key = (indicator.name, indicator.larger_is_better)
+        try:
+            return self._monotone[key]
+        except KeyError:
+            pass
+
+        values = self._data[indicator.name].to_numpy()
+
+        # Indicators are often logged as best-so-far values and are monotone
+        # already. Checking this is much cheaper than accumulating and allows
+        # using the NumPy view without a copy. NaN values fail the check.
+        not_worse = np.greater_equal if indicator.larger_is_better else np.less_equal
+        if values.dtype == np.float64 and not_worse(values[1:], values[:-1]).all():
+            self._monotone[key] = values
+        else:
+            # Like polars' `cum_max` and `cum_min`, `fmax` and `fmin` skip NaN values.
+            accumulate = np.fmax.accumulate if indicator.larger_is_better else np.fmin.accumulate
+            values = accumulate(values, dtype=np.float64)
+            # Only leading NaN values remain. They count as the worst possible
+            # value so that no target is reached before the first valid value.
+            values[np.isnan(values)] = -np.inf if indicator.larger_is_better else np.inf
+            self._monotone[key] = values
+        return self._monotone[key]
+
+    def _at_indicator_arrays(self, indicator: ind.Indicator, targets, per_dimension: bool = True, out=None):
+        """Return the (per dimension) runtime needed to reach each target and whether it was hit"""
         if indicator.name not in self.indicators:
             raise NoSuchIndicatorException(indicator)
 
-        fvals = self._data["__fevals"]
+        fvals = self._fevals_dim_np if per_dimension else self._fevals_np
+        ivals = self._monotone_indicator(indicator)
+        return target_runtimes(ivals, fvals, targets, indicator.larger_is_better, out=out)
 
-        # Make sure indicator values are monotonic
-        if indicator.larger_is_better:
-            ivals = self._data[indicator.name].cum_max()
-        else:
-            ivals = self._data[indicator.name].cum_min()
+    def at_indicator(self, indicator: Union[ind.Indicator, str], targets):
+        indicator = ind.resolve(indicator)
+        target_fvals, target_hit = self._at_indicator_arrays(indicator, targets, per_dimension=False)
+        data = pl.DataFrame(
+            [
+                pl.Series("__fevals", target_fvals),
+                pl.Series(indicator.name, targets),
+                pl.Series("__target_hit", target_hit.astype(np.float64)),
+                pl.Series("__fevals_dim", target_fvals / self.problem.number_of_variables),
+            ]
+        )
 
-        target_fvals: npt.NDArray[np.float64] = fvals.max() * np.ones(len(targets))
-        target_hit = np.zeros(len(targets))
+        # Targets ordered by increasing difficulty yield sorted fevals, only
+        # sort if they are not.
+        if np.any(np.diff(target_fvals) < 0):
+            data = data.sort("__fevals", maintain_order=True)
 
-        indicator_idx = 0
-        try:
-            for i, target in enumerate(targets):
-                ## FIXME: This is ugly duplication, but I don't know of
-                ## a more elegant way to write it. :/
-                if indicator.larger_is_better:
-                    while ivals[indicator_idx] < target:
-                        indicator_idx += 1
-                else:
-                    while ivals[indicator_idx] > target:
-                        indicator_idx += 1
-                target_fvals[i] = fvals[indicator_idx]
-                target_hit[i] = True
-        except IndexError:
-            pass  # Break if indicator_idx goes out of bounds
-
-        return self.__class__(
-            self.algorithm,
-            self.problem,
-            pl.DataFrame(
-                [
-                    pl.Series("fevals", target_fvals),
-                    pl.Series(indicator.name, targets),
-                    pl.Series("__target_hit", target_hit),
-                ]
-            ),
-        )
+        return self._from_canonical(self.algorithm, self.problem, data)
 
     def to_parquet(self, path: FilePath):
         """Write results to a parquet file"""
@@ -192,18 +291,75 @@ class Result:
     @classmethod
     def from_parquet(cls, path: FilePath):
         """Read results from a parquet file."""
+        algorithm, problem, lf = cls._scan_parquet(path)
+        return cls._from_scan(algorithm, problem, lf.collect())
+
+    @classmethod
+    def from_parquet_many(cls, paths: Iterable[FilePath]) -> list[Result]:
+        """Read results from several parquet files.
+
+        The files are decoded concurrently by polars, which is considerably
+        faster than calling `from_parquet` for each file when loading many
+        results.
+
+        Parameters
+        ----------
+        paths : iterable of str or path-like
+            Parquet files written by `to_parquet`.
+
+        Returns
+        -------
+        list of Result
+            Results in the same order as `paths`.
+        """
+        scans = [cls._scan_parquet(path) for path in paths]
+        frames = pl.collect_all([lf for _, _, lf in scans])
+        return [cls._from_scan(algorithm, problem, data) for (algorithm, problem, _), data in zip(scans, frames)]
+
+    @staticmethod
+    def _scan_parquet(path: FilePath) -> tuple[str, ProblemDescription, pl.LazyFrame]:
+        """Read the metadata of a parquet file and lazily scan its data"""
         import pyarrow.parquet as pq
 
-        tbl = pq.read_table(path)
-        algorithm = tbl.schema.metadata[b"algorithm"].decode("utf8")
-        problem = ProblemDescription.from_json(tbl.schema.metadata[b"problem"].decode("utf8"))
-        data = pl.from_arrow(tbl)
+        # Only read the footer with pyarrow to get the metadata, the data is
+        # scanned by polars.
+        schema = pq.read_schema(path)
+        algorithm = schema.metadata[b"algorithm"].decode("utf8")
+        problem = ProblemDescription.from_json(schema.metadata[b"problem"].decode("utf8"))
+
+        lf = pl.scan_parquet(str(path))
+        if "__fevals_dim" not in schema.names:
+            # Fuse sorting and normalization with the scan
+            lf = lf.sort("__fevals").with_columns(
+                (pl.col("__fevals") / problem.number_of_variables).alias("__fevals_dim")
+            )
+        return algorithm, problem, lf
 
+    @classmethod
+    def _from_scan(cls, algorithm: str, problem: ProblemDescription, data: pl.DataFrame):
+        # Files written by `to_parquet` are already in canonical form
+        if data["__fevals"].is_sorted():
+            return cls._from_canonical(algorithm, problem, data)
         return cls(algorithm, problem, data, "__fevals")
 
 
+# Keys by which a `ResultSet` groups its results
 class ResultSet:
-    def __init__(self, results=[]):
+    __slots__ = (
+        "algorithms",
+        "problems",
+        "problem_classes",
+        "problem_instances",
+        "number_of_variables",
+        "number_of_objectives",
+        "_results",
+        "_algorithm_index",
+        "_problem_index",
+        "_sorted_keys",
+        "_property_groups",
+    )
+
+    def __init__(self, results=None):
         self.algorithms = set()
         self.problems = set()
         self.problem_classes = set()
@@ -212,8 +368,37 @@ class ResultSet:
         self.number_of_objectives = set()
         self._results = []
 
-        for r in results:
-            self.append(r)
+        # Results indexed by algorithm and problem, maintained by `append`, and
+        # the sorted keys of both indexes, computed on first use. Groupings by
+        # problem property are built on first use and dropped by `append`.
+        self._algorithm_index = {}
+        self._problem_index = {}
+        self._sorted_keys = {}
+        self._property_groups = {}
+
+        if results is not None:
+            self.extend(results)
+
+    @classmethod
+    def _from_group(cls, results: list[Result]) -> ResultSet:
+        """Create a ResultSet from a group of results of another ResultSet.
+
+        The results were already checked when they were added to the other
+        ResultSet, and the indexes of the new ResultSet are built on first use.
+        """
+        res = cls.__new__(cls)
+        res._results = list(results)
+        res.algorithms = {r.algorithm for r in results}
+        res.problems = {r.problem for r in results}
+        res.problem_classes = {p.name for p in res.problems}
+        res.problem_instances = {p.instance for p in res.problems}
+        res.number_of_variables = {p.number_of_variables for p in res.problems}
+        res.number_of_objectives = {p.number_of_objectives for p in res.problems}
+        res._algorithm_index = None
+        res._problem_index = None
+        res._sorted_keys = {}
+        res._property_groups = {}
+        return res
 
     def __getitem__(self, key: int) -> Result:
         return self._results[key]
@@ -231,13 +416,44 @@ class ResultSet:
             raise IndicatorMismatchException(
                 "Indicators in results don't match: {self._results[0].indicators} vs {result.indicators}"
             )
-        self.algorithms.add(result.algorithm)
-        self.problems.add(result.problem)
-        self.number_of_variables.add(result.problem.number_of_variables)
-        self.number_of_objectives.add(result.problem.number_of_objectives)
+        if self._algorithm_index is None:
+            self._build_indexes()
         self._results.append(result)
+        self._add_to_indexes(result)
+        if self._property_groups:
+            self._property_groups.clear()
         return self
 
+    def _add_to_indexes(self, result: Result):
+        # The sets of algorithms and problem properties only change with a new
+        # algorithm or problem, which is when a new key is added to an index.
+        results = self._algorithm_index.get(result.algorithm)
+        if results is None:
+            self._algorithm_index[result.algorithm] = [result]
+            self._sorted_keys.pop("algorithm", None)
+            self.algorithms.add(result.algorithm)
+        else:
+            results.append(result)
+
+        problem = result.problem
+        results = self._problem_index.get(problem)
+        if results is None:
+            self._problem_index[problem] = [result]
+            self._sorted_keys.pop("problem", None)
+            self.problems.add(problem)
+            self.problem_classes.add(problem.name)
+            self.problem_instances.add(problem.instance)
+            self.number_of_variables.add(problem.number_of_variables)
+            self.number_of_objectives.add(problem.number_of_objectives)
+        else:
+            results.append(result)
+
+    def _build_indexes(self):
+        self._algorithm_index = {}
+        self._problem_index = {}
+        for result in self._results:
+            self._add_to_indexes(result)
+
     def extend(self, results: Sequence[Result]):
         """Extend a ResultSet with a sequence of `Result`s or another `ResultSetǹ.
 
@@ -269,51 +485,40 @@ class ResultSet:
                 res.append(result)
         return res
 
+    def _by_index(self, name: str) -> Generator[tuple[Any, ResultSet], Any, None]:
+        """Yield the results grouped by algorithm or problem in order of the key"""
+        if self._algorithm_index is None:
+            self._build_indexes()
+        index = self._algorithm_index if name == "algorithm" else self._problem_index
+        if name not in self._sorted_keys:
+            self._sorted_keys[name] = tuple(sorted(index))
+        for value in self._sorted_keys[name]:
+            yield value, ResultSet._from_group(index[value])
+
     def by_algorithm(self) -> Generator[tuple[str, ResultSet], Any, None]:
-        ## FIXME: Caution, this is potentially quadratic !
-        for algorithm in sorted(self.algorithms):
-            ss = ResultSet()
-            for result in self._results:
-                if result.algorithm == algorithm:
-                    ss.append(result)
-            if len(ss) > 0:
-                yield algorithm, ss
+        return self._by_index("algorithm")
 
     def by_problem(self) -> Generator[tuple[ProblemDescription, ResultSet], Any, None]:
-        ## FIXME: Caution, this is potentially quadratic!
-        for problem in sorted(self.problems):
-            ss = ResultSet()
-            for result in self._results:
-                if result.problem == problem:
-                    ss.append(result)
-            if len(ss) > 0:
-                yield problem, ss
-
-    def _by_int_problem_property(self, property: str) -> Generator[tuple[int, ResultSet], Any, None]:
-        values = set()
-        for problem in self.problems:
-            values.add(getattr(problem, property))
-
-        for value in sorted(values):
-            ss = ResultSet()
-            for result in self._results:
-                if getattr(result.problem, property) == value:
-                    ss.append(result)
-            if len(ss) > 0:
-                yield value, ss
+        return self._by_index("problem")
 
     def _by_problem_property(self, property: str) -> Generator[tuple[Union[int, str], ResultSet], Any, None]:
-        values = set()
-        for problem in self.problems:
-            values.add(getattr(problem, property))
+        """Yield the results grouped by a problem property in order of its value.
 
-        for value in sorted(values):
-            ss = ResultSet()
+        The grouping is built in a single pass on first use and cached until
+        the next call to `append`.
+        """
+        if property not in self._property_groups:
+            groups = {}
             for result in self._results:
-                if getattr(result.problem, property) == value:
-                    ss.append(result)
-            if len(ss) > 0:
-                yield value, ss
+                value = getattr(result.problem, property)
+                if value in groups:
+                    groups[value].append(result)
+                else:
+                    groups[value] = [result]
+            self._property_groups[property] = sorted(groups.items())
+
+        for value, results in self._property_groups[property]:
+            yield value, ResultSet._from_group(results)
 
     def by_problem_name(self) -> Generator[tuple[Union[int, str], ResultSet], Any, None]:
         return self._by_problem_property("name")
@@ -322,7 +527,7 @@ class ResultSet:
         return self._by_problem_property("instance")
 
     def by_number_of_variables(self) -> Generator[tuple[int, ResultSet], Any, None]:
-        return self._by_int_problem_property("number_of_variables")
+        return self._by_problem_property("number_of_variables")
 
     def by_number_of_objectives(self) -> Generator[tuple[int, ResultSet], Any, None]:
-        return self._by_int_problem_property("number_of_objectives")
+        return self._by_problem_property("number_of_objectives")
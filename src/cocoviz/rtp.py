@@ -1,19 +1,21 @@
 """Runtime profiles"""
 
-import matplotlib.pyplot as plt
-import matplotlib.figure as mfigure
-import matplotlib.transforms as mtransforms
-import polars as pl
-import scipy.stats as stats
-
 from typing import Union
 
+import numpy as np
+
 from . import indicator as ind
 from .targets import linear_targets
+from ._kernels import kaplan_meier
 from .result import ResultSet
 from .exceptions import BadRuntimeProfileException
 
 
+def _sorted_targets(targets, larger_is_better: bool) -> np.ndarray:
+    targets = np.sort(np.asarray(targets, dtype=np.float64))
+    return targets if larger_is_better else np.ascontiguousarray(targets[::-1])
+
+
 def runtime_profiles(
     results: ResultSet,
     indicator: Union[ind.Indicator, str],
@@ -58,14 +60,21 @@ def runtime_profiles(
     if not targets:
         targets = linear_targets(results, indicator, number_of_targets)
 
-    # Get (approximate) runtime to reach each target of indicator
-    indicator_results = ResultSet()
-    for r in results:
-        indicator_results.append(r.at_indicator(indicator, targets[r.problem]))
+    # Convert the targets of each problem once and order them by increasing
+    # difficulty, so that the target search is a single pass over each result.
+    # The order of the targets does not affect the runtime profile.
+    targets = {problem: _sorted_targets(t, indicator.larger_is_better) for problem, t in targets.items()}
+
+    # Get (approximate) runtime to reach each target of indicator. The runtimes
+    # of all results are written into one pair of buffers, grouped by algorithm,
+    # so that the runtimes of each algorithm are a contiguous slice.
+    by_algorithm = list(results.by_algorithm())
+    size = sum(len(targets[r.problem]) for r in results)
+    fevals_dim = np.empty(size)
+    target_hit = np.empty(size, dtype=np.bool_)
 
-    res = {}
     n_results = None
-    for algo, algo_results in indicator_results.by_algorithm():
+    for algo, algo_results in by_algorithm:
         # Make sure each algorithm has the same number of repetitions/runs If
         # not, raise an exception for now. In the future we could try to down-
         # or upsample the offending algorithm.
@@ -76,22 +85,22 @@ def runtime_profiles(
                 f"Expected {n_results} results for algorithm {algo}, found {len(algo_results)}."
             )
 
-        rtlist = []
+    slices = {}
+    offset = 0
+    for algo, algo_results in by_algorithm:
+        start = offset
+        for r in algo_results:
+            end = offset + len(targets[r.problem])
+            r._at_indicator_arrays(indicator, targets[r.problem], out=(fevals_dim[offset:end], target_hit[offset:end]))
+            offset = end
+        slices[algo] = slice(start, offset)
 
-        for algo_result in algo_results:
-            rtlist.append(algo_result._data[["__fevals_dim", "__target_hit"]])
-
-        runtimes: pl.DataFrame = pl.concat(rtlist)
-        ecdf = stats.ecdf(
-            stats.CensoredData(
-                runtimes["__fevals_dim"].filter(runtimes["__target_hit"] > 0).to_numpy(),
-                right=runtimes["__fevals_dim"].filter(runtimes["__target_hit"] == 0).to_numpy(),
-            )
-        ).cdf
-        # FIXME: No CIs for now...
-        # res[algo] = (ecdf.quantiles, ecdf.probabilities, ecdf.confidence_interval())
-        res[algo] = (ecdf.quantiles, ecdf.probabilities)
-    return res
+    # FIXME: No CIs for now...
+    profiles = {}
+    for algo, _ in by_algorithm:
+        algo_fevals_dim, algo_hit = fevals_dim[slices[algo]], target_hit[slices[algo]]
+        profiles[algo] = kaplan_meier(algo_fevals_dim[algo_hit], algo_fevals_dim[~algo_hit])
+    return profiles
 
 
 def rtpplot(
@@ -128,20 +137,47 @@ def rtpplot(
         If `ax` is provided, it is returned.
         Otherwise a new figure is created and the corresponding Axes object is returned.
     """
+    # matplotlib is only imported when plotting to keep `import cocoviz` fast
+    import matplotlib.cbook as mcbook
+    import matplotlib.collections as mcollections
+    import matplotlib.colors as mcolors
+    import matplotlib.figure as mfigure
+    import matplotlib.pyplot as plt
+    import matplotlib.transforms as mtransforms
+
     profiles = runtime_profiles(results, indicator, number_of_targets=number_of_targets, targets=targets)
     if ax is None:
         fig, ax = plt.subplots()
     else:
         fig: mfigure.Figure = ax.figure
 
+    # Draw all profiles as a single collection of step functions instead of
+    # one artist per algorithm. An empty line per algorithm takes the next style
+    # from the axes property cycle and serves as its legend entry. It is removed
+    # from the axes again, so that the collection is the only artist drawn.
+    segments, handles = [], []
     for algo, (fevals, prob) in profiles.items():
-        (line,) = ax.step(fevals, 100 * prob, label=algo)
+        segments.append(np.column_stack(mcbook.pts_to_prestep(fevals, 100 * prob)))
+        (handle,) = ax.plot([], [], label=algo)
+        # Resolve colors such as "C0" now, so that legend and profile agree
+        handle.set_color(mcolors.to_rgba(handle.get_color()))
+        handle.remove()
+        handles.append(handle)
+    ax.add_collection(
+        mcollections.LineCollection(
+            segments,
+            colors=[h.get_color() for h in handles],
+            linestyles=[h.get_linestyle() for h in handles],
+            linewidths=[h.get_linewidth() for h in handles],
+        )
+    )
+    ax.autoscale_view()
 
     ax.set_xscale("log")
     ax.grid(True, which="both", color="lightgrey")
-    ax.legend(title="Algorithms")
+    ax.legend(handles=handles, title="Algorithms")
 
-    problems = sorted(set(p.name for p in results.problems))
+    problems = sorted(results.problem_classes)
     if len(problems) > 1:
         offset = mtransforms.ScaledTranslation(10 / 72.0, -10 / 72.0, fig.dpi_scale_trans)
         ax.text(
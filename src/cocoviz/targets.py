@@ -8,23 +8,37 @@ from . import indicator as ind
 from .result import ProblemDescription, ResultSet
 
 
+def _indicator_values(results: ResultSet, name: str):
+    """Yield each problem in `results` with the values of indicator `name` of all its results
+
+    The values are concatenated per problem only, so different problems may
+    store the indicator with different data types.
+    """
+    for problem, problem_results in results.by_problem():
+        yield problem, pl.concat([r._data.get_column(name) for r in problem_results], rechunk=False)
+
+
+def _indicator_ranges(results: ResultSet, name: str) -> dict[ProblemDescription, tuple[float, float]]:
+    """Return the smallest and largest value of indicator `name` for each problem in `results`"""
+    return {problem: (values.min(), values.max()) for problem, values in _indicator_values(results, name)}
+
+
 def log_targets(results: ResultSet, indicator: ind.Indicator | str, number_of_targets: int = 101):
     indicator = ind.resolve(indicator)
 
-    targets = {}
-    for desc, problem_results in results.by_problem():
-        indicator_values = pl.concat([r._data for r in problem_results])[indicator.name]
-        low = indicator_values.min()
-        high = indicator_values.max()
-        delta = high - low
+    # Like `linear_targets`, order the targets by increasing difficulty, i.e.
+    # descending for indicators that are minimized. Reversing the multipliers
+    # once yields contiguous targets instead of a reversed view per problem.
+    mul = np.logspace(-16, 0, number_of_targets)
+    if not indicator.larger_is_better:
+        mul = mul[::-1]
 
-        mul = np.logspace(-16, 0, number_of_targets)
+    targets = {}
+    for desc, (low, high) in _indicator_ranges(results, indicator.name).items():
         if low == high:
             targets[desc] = np.linspace(low, high, 1)
-        elif indicator.larger_is_better:
-            targets[desc] = low + delta * mul
         else:
-            targets[desc] = np.flip(low + delta * mul)
+            targets[desc] = low + (high - low) * mul
     return targets
 
 
@@ -34,11 +48,7 @@ def linear_targets(
     indicator = ind.resolve(indicator)
 
     targets = {}
-    for desc, problem_results in results.by_problem():
-        indicator_values = pl.concat([r._data for r in problem_results])[indicator.name]
-        low = indicator_values.min()
-        high = indicator_values.max()
-
+    for desc, (low, high) in _indicator_ranges(results, indicator.name).items():
         # If the indicator is constant, only generate one target.
         if low == high:
             targets[desc] = np.linspace(low, high, 1)
@@ -51,9 +61,4 @@ def linear_targets(
 
 
 def full_targets(results: ResultSet, indicator: str) -> dict[ProblemDescription, ArrayLike]:
-    targets = {}
-    for desc, problem_results in results.by_problem():
-        indicator_values = pl.concat([r._data for r in problem_results])[indicator]
-        targets[desc] = indicator_values.unique().sort()
-
-    return targets
+    return {problem: values.unique().sort() for problem, values in _indicator_values(results, indicator)}
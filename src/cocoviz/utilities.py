@@ -1,6 +1,9 @@
 import colorsys
 from typing import List
 
+import numpy as np
+import numpy.typing as npt
+
 
 def scale_lightness(rgb: List[float], scale_l: float):
     """Scale the lightness of a RGB color.
@@ -21,3 +24,55 @@ def scale_lightness(rgb: List[float], scale_l: float):
     """
     hue, lightness, saturation = colorsys.rgb_to_hls(*rgb)
     return colorsys.hls_to_rgb(hue, min(1, lightness * scale_l), saturation)
+
+
+def scale_lightness_array(rgb: npt.ArrayLike, scale_l: npt.ArrayLike) -> np.ndarray:
+    """Scale the lightness of many RGB colors at once.
+
+    Vectorized version of `scale_lightness`, the result is the same as applying
+    `scale_lightness` to each color up to floating point rounding.
+
+    Parameters
+    ----------
+    rgb : array_like, shape (..., 3)
+        Red, green and blue values of the colors.
+    scale_l : float or array_like
+        Scaling factor for the lightness, broadcast against the colors.
+
+    Returns
+    -------
+    ndarray, shape (..., 3)
+        Red, green and blue values of the lightened or darkened colors.
+    """
+    rgb = np.asarray(rgb, dtype=np.float64)
+    r, g, b = rgb[..., 0], rgb[..., 1], rgb[..., 2]
+
+    # RGB to HLS, see `colorsys.rgb_to_hls`. Gray colors have no hue and
+    # saturation, their (invalid) intermediate values are replaced below.
+    maxc, minc = rgb.max(axis=-1), rgb.min(axis=-1)
+    sumc, rangec = maxc + minc, maxc - minc
+    lightness = sumc / 2.0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        saturation = np.where(lightness <= 0.5, rangec / sumc, rangec / (2.0 - maxc - minc))
+        rc, gc, bc = (maxc - r) / rangec, (maxc - g) / rangec, (maxc - b) / rangec
+    hue = np.where(r == maxc, bc - gc, np.where(g == maxc, 2.0 + rc - bc, 4.0 + gc - rc))
+    hue = (hue / 6.0) % 1.0
+    gray = minc == maxc
+    hue, saturation = np.where(gray, 0.0, hue), np.where(gray, 0.0, saturation)
+
+    lightness = np.minimum(1, lightness * scale_l)
+
+    # HLS to RGB, see `colorsys.hls_to_rgb`
+    m2 = np.where(lightness <= 0.5, lightness * (1.0 + saturation), lightness + saturation - (lightness * saturation))
+    m1 = 2.0 * lightness - m2
+
+    def channel(hue):
+        hue = hue % 1.0
+        return np.select(
+            [hue < 1.0 / 6.0, hue < 0.5, hue < 2.0 / 3.0],
+            [m1 + (m2 - m1) * hue * 6.0, m2, m1 + (m2 - m1) * (2.0 / 3.0 - hue) * 6.0],
+            m1,
+        )
+
+    res = np.stack([channel(hue + 1.0 / 3.0), channel(hue), channel(hue - 1.0 / 3.0)], axis=-1)
+    return np.where((saturation == 0.0)[..., np.newaxis], lightness[..., np.newaxis], res)
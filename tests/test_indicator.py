@@ -0,0 +1,19 @@
+import pytest
+
+import cocoviz.indicator as ci
+from cocoviz.exceptions import UnknownIndicatorException
+
+
+def test_resolve_after_reregister():
+    assert ci.resolve("hv").larger_is_better
+
+    with pytest.warns(UserWarning):
+        ci.register(ci.Indicator("hv", larger_is_better=False))
+    assert not ci.resolve("hv").larger_is_better
+
+    ci.deregister("hv")
+    with pytest.raises(UnknownIndicatorException):
+        ci.resolve("hv")
+
+    ci.register(ci.Indicator("hv", display_name="Hypervolume", larger_is_better=True))
+    assert ci.resolve("hv").larger_is_better
@@ -0,0 +1,41 @@
+import numpy as np
+import pytest
+
+import cocoviz._kernels as kernels
+
+
+IVALS = [10, 20, 30, 40, 50, 60, 70]
+FEVALS = [1, 2, 3, 10, 20, 50, 100]
+
+
+@pytest.mark.parametrize(
+    "targets, larger_is_better, fevals, hit",
+    [
+        ([15, 25, 35, 120], True, [2, 3, 10, 100], [1, 1, 1, 0]),
+        ([35, 15, 120, 25], True, [10, 2, 100, 3], [1, 1, 0, 1]),
+        ([5, 10, 65, 70], False, [100, 100, 2, 1], [0, 1, 1, 1]),
+    ],
+)
+def test_target_runtimes(targets, larger_is_better, fevals, hit):
+    ivals = IVALS if larger_is_better else IVALS[::-1]
+    target_fevals, target_hit = kernels.target_runtimes(ivals, FEVALS, targets, larger_is_better)
+    np.testing.assert_array_equal(target_fevals, fevals)
+    np.testing.assert_array_equal(target_hit, hit)
+
+
+def test_target_runtimes_empty():
+    with pytest.raises(ValueError):
+        kernels.target_runtimes([], [], [1.0, 2.0], True)
+
+
+@pytest.mark.parametrize("n_uncensored, n_censored", [(40, 0), (40, 5), (40, 40), (0, 40), (0, 0)])
+def test_kaplan_meier(n_uncensored, n_censored):
+    stats = pytest.importorskip("scipy.stats")
+    rng = np.random.default_rng(42)
+    uncensored = rng.integers(1, 20, size=n_uncensored).astype(float)
+    right_censored = rng.integers(1, 20, size=n_censored).astype(float)
+
+    quantiles, probabilities = kernels.kaplan_meier(uncensored, right_censored)
+    ecdf = stats.ecdf(stats.CensoredData(uncensored, right=right_censored)).cdf
+    np.testing.assert_array_equal(quantiles, ecdf.quantiles)
+    np.testing.assert_array_equal(probabilities, ecdf.probabilities)
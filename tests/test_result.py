@@ -1,4 +1,7 @@
+import dataclasses
 import logging
+import pickle
+import pytest
 import polars as pl
 
 from polars.testing import assert_frame_equal
@@ -27,6 +30,39 @@ def test_fevals_column(caplog):
     assert "Assuming first column" in caplog.text
 
 
+def test_unsorted_fevals():
+    res = Result("a1", pd_f1, {"fevals": [3, 1, 2], "hypervolume": [30, 10, 20]})
+    assert res._data["__fevals"].to_list() == [1, 2, 3]
+    assert res["hypervolume"].to_list() == [10, 20, 30]
+
+
+def test_at_indicator_monotone_values():
+    # Best-so-far values are used as is, other values are accumulated
+    res = Result("a1", pd_f1, {"fevals": [1, 2, 3, 4], "hypervolume": [1.0, 2.0, 2.0, 3.0], "r2": [4.0, 2.0, 3.0, 1.0]})
+    assert res.at_indicator("hypervolume", [2.0, 3.0])._data["__fevals"].to_list() == [2.0, 4.0]
+    assert res.at_indicator("r2", [2.0, 1.0])._data["__fevals"].to_list() == [2.0, 4.0]
+
+    res = Result("a1", pd_f1, {"fevals": [1, 2, 3, 4], "hypervolume": [1.0, 3.0, 2.0, 4.0]})
+    assert res.at_indicator("hypervolume", [2.0, 3.0])._data["__fevals"].to_list() == [2.0, 2.0]
+
+    res = Result("a1", pd_f1, {"fevals": [1, 2, 3], "hypervolume": [1.0, float("nan"), 2.0]})
+    assert res.at_indicator("hypervolume", [1.0, 2.0])._data["__fevals"].to_list() == [1.0, 3.0]
+
+    # Leading NaN values do not reach any target
+    res = Result(
+        "a1", pd_f1, {"fevals": [1, 2, 3], "hypervolume": [float("nan"), 1.0, 2.0], "r2": [float("nan"), 2.0, 1.0]}
+    )
+    assert res.at_indicator("hypervolume", [1.5, 2.0])._data["__fevals"].to_list() == [3.0, 3.0]
+    assert res.at_indicator("r2", [1.5, 1.0])._data["__fevals"].to_list() == [3.0, 3.0]
+    assert res.at_indicator("hypervolume", [0.5])._data["__target_hit"].to_list() == [1.0]
+
+
+def test_at_indicator_empty():
+    res = Result("a1", pd_f1, {"fevals": [], "hypervolume": []})
+    with pytest.raises(ValueError):
+        res.at_indicator("hypervolume", [1.0, 2.0])
+
+
 def test_at_indicator():
     targets = [15, 25, 35, 120]
 
@@ -44,3 +80,115 @@ def test_at_indicator():
     )
 
     assert_frame_equal(ind._data, true_ind)
+
+
+def test_at_indicator_minimize():
+    targets = [30, 20, 10]
+
+    res = Result("a1", pd_f1, HV_a1)
+
+    ind = res.at_indicator("r2", targets)
+
+    true_ind = pl.DataFrame(
+        [
+            pl.Series("__fevals", [1.0, 1.0, 100.0], dtype=pl.Float64),
+            pl.Series("r2", [30, 20, 10], dtype=pl.Int64),
+            pl.Series("__target_hit", [1.0, 1.0, 0.0], dtype=pl.Float64),
+            pl.Series("__fevals_dim", [0.1, 0.1, 10.0], dtype=pl.Float64),
+        ]
+    )
+
+    assert_frame_equal(ind._data, true_ind)
+
+
+def test_setitem():
+    res = Result("a1", pd_f1, HV_a1)
+    res.at_indicator("hypervolume", [15])
+    indicators = res.indicators
+
+    res["hypervolume"] = [70, 60, 50, 40, 30, 20, 10]
+    res["igd+"] = [7, 6, 5, 4, 3, 2, 1]
+
+    assert res.indicators == {"hypervolume", "r2", "igd+"}
+    assert indicators == {"hypervolume", "r2"}
+    assert res["igd+"].to_list() == [7, 6, 5, 4, 3, 2, 1]
+    assert res.at_indicator("hypervolume", [15])["hypervolume"].to_list() == [15]
+    assert res.at_indicator("hypervolume", [15])._data["__fevals"].to_list() == [1.0]
+
+
+def test_parquet_roundtrip(tmp_path):
+    pytest.importorskip("pyarrow")
+    res = Result("a1", pd_f1, HV_a1)
+
+    res.to_parquet(tmp_path / "a1.parquet")
+    read = Result.from_parquet(tmp_path / "a1.parquet")
+
+    assert read.algorithm == "a1"
+    assert read.problem == pd_f1
+    assert read.indicators == res.indicators
+    assert_frame_equal(read._data, res._data)
+
+
+def test_from_parquet_many(tmp_path):
+    pytest.importorskip("pyarrow")
+    results = [Result("a1", pd_f1, HV_a1), Result("a2", ProblemDescription("f2", "i1", 5, 2), HV_a1)]
+    paths = [tmp_path / f"{res.algorithm}.parquet" for res in results]
+    for res, path in zip(results, paths):
+        res.to_parquet(path)
+
+    read = Result.from_parquet_many(paths)
+
+    assert [r.algorithm for r in read] == ["a1", "a2"]
+    for r, res in zip(read, results):
+        assert r.problem == res.problem
+        assert_frame_equal(r._data, res._data)
+
+
+def test_at_indicator_unsorted_targets():
+    res = Result("a1", pd_f1, HV_a1)
+
+    ind = res.at_indicator("hypervolume", [35, 120, 15, 25])
+
+    assert ind._data["__fevals"].to_list() == [2.0, 3.0, 10.0, 100.0]
+    assert ind._data["hypervolume"].to_list() == [15, 25, 35, 120]
+    assert ind._data["__target_hit"].to_list() == [1.0, 1.0, 1.0, 0.0]
+
+
+def test_problem_description():
+    assert ProblemDescription.from_json(pd_f1.to_json()) == pd_f1
+    assert pickle.loads(pickle.dumps(pd_f1)) == pd_f1
+    assert hash(pickle.loads(pickle.dumps(pd_f1))) == hash(pd_f1)
+    assert {pd_f1: 1}[ProblemDescription("f1", "i1", 10, 2)] == 1
+    assert pd_f1 < ProblemDescription("f2", "i1", 10, 2)
+
+    # The cached hash is not a dataclass field
+    assert [f.name for f in dataclasses.fields(pd_f1)] == [
+        "name",
+        "instance",
+        "number_of_variables",
+        "number_of_objectives",
+    ]
+    assert dataclasses.astuple(pd_f1) == ("f1", "i1", 10, 2)
+    assert ProblemDescription(**dataclasses.asdict(pd_f1)) == pd_f1
+
+
+def test_problem_description_get():
+    problem = ProblemDescription.get("f1", "i1", 10, 2)
+    assert problem == pd_f1
+    assert ProblemDescription.get("f1", "i1", 10, 2) is problem
+    assert ProblemDescription.from_json(pd_f1.to_json()) is problem
+    assert ProblemDescription.get("f1", "i2", 10, 2) is not problem
+
+
+def test_from_parquet_without_fevals_dim(tmp_path):
+    pa = pytest.importorskip("pyarrow")
+    pq = pytest.importorskip("pyarrow.parquet")
+    tbl = pa.table({"__fevals": [3, 1, 2], "hypervolume": [30, 10, 20]})
+    tbl = tbl.replace_schema_metadata({"algorithm": "a1", "problem": pd_f1.to_json()})
+    pq.write_table(tbl, str(tmp_path / "a1.parquet"))
+
+    res = Result.from_parquet(tmp_path / "a1.parquet")
+
+    assert res.indicators == {"hypervolume"}
+    assert res._data["__fevals"].to_list() == [1, 2, 3]
+    assert res._data["__fevals_dim"].to_list() == pytest.approx([0.1, 0.2, 0.3])
@@ -40,3 +40,38 @@ def test_indicator_mismatch():
         rs = ResultSet()
         rs.append(r2)
         rs.append(r1)
+
+
+def test_by_algorithm():
+    pd_f1 = ProblemDescription("f1", "i1", 10, 2)
+    pd_f2 = ProblemDescription("f2", "i1", 10, 2)
+    rs = ResultSet(
+        [Result("a2", pd_f1, HV_a2), Result("a1", pd_f1, HV_a1), Result("a2", pd_f2, HV_a2), Result("a1", pd_f2, HV_a1)]
+    )
+
+    groups = [(algo, [r.problem.name for r in ss]) for algo, ss in rs.by_algorithm()]
+    assert groups == [("a1", ["f1", "f2"]), ("a2", ["f1", "f2"])]
+
+    assert rs.problem_classes == {"f1", "f2"}
+    assert rs.problem_instances == {"i1"}
+    assert rs.number_of_variables == {10}
+    assert rs.number_of_objectives == {2}
+
+    # Appending a result must invalidate the cached groups
+    rs.append(Result("a3", pd_f1, HV_a1))
+    assert [algo for algo, _ in rs.by_algorithm()] == ["a1", "a2", "a3"]
+    assert [len(ss) for _, ss in rs.by_problem()] == [3, 2]
+
+    # Modifying a group must not modify the cached groups
+    for _, ss in rs.by_algorithm():
+        ss.append(Result("a3", pd_f2, HV_a1))
+    assert [len(ss) for _, ss in rs.by_algorithm()] == [2, 2, 1]
+
+    # Groups index their results on first use and when they are modified
+    _, ss = next(rs.by_algorithm())
+    assert ss.algorithms == {"a1"} and ss.problems == {pd_f1, pd_f2}
+    assert [problem.name for problem, _ in ss.by_problem()] == ["f1", "f2"]
+    ss.append(Result("a4", ProblemDescription("f3", "i2", 5, 2), HV_a1))
+    assert [algo for algo, _ in ss.by_algorithm()] == ["a1", "a4"]
+    assert [n for n, _ in ss.by_number_of_variables()] == [5, 10]
+    assert ss.problem_instances == {"i1", "i2"}
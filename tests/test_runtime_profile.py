@@ -1,7 +1,8 @@
+import numpy as np
 import pytest
 
 from cocoviz.exceptions import BadRuntimeProfileException
-from cocoviz import runtime_profiles, Result, ResultSet, ProblemDescription
+from cocoviz import rtpplot, runtime_profiles, Result, ResultSet, ProblemDescription
 
 
 HV_a1 = {
@@ -33,3 +34,83 @@ def test_aggregate_over_variables():
 
     with pytest.raises(BadRuntimeProfileException):
         runtime_profiles(rs, indicator="hypervolume")
+
+
+def test_runtime_profiles():
+    pd_f1 = ProblemDescription("f1", "i1", 10, 2)
+    rs = ResultSet([Result("a1", pd_f1, HV_a1), Result("a2", pd_f1, HV_a2)])
+
+    profiles = runtime_profiles(rs, indicator="hypervolume", targets={pd_f1: [15, 25, 35, 120]})
+
+    assert list(profiles.keys()) == ["a1", "a2"]
+    for fevals, prob in profiles.values():
+        np.testing.assert_allclose(fevals, [0.2, 0.3, 1.0, 10.0])
+        np.testing.assert_allclose(prob, [0.25, 0.5, 0.75, 0.75])
+
+
+def test_runtime_profiles_minimize():
+    pd_f1 = ProblemDescription("f1", "i1", 10, 2)
+    rs = ResultSet([Result("a1", pd_f1, HV_a1), Result("a2", pd_f1, HV_a2)])
+
+    profiles = runtime_profiles(rs, indicator="r2")
+
+    np.testing.assert_allclose(profiles["a1"][0], [0.1])
+    np.testing.assert_allclose(profiles["a1"][1], [1.0])
+    np.testing.assert_allclose(profiles["a2"][0], [0.1, 10.0])
+    np.testing.assert_allclose(profiles["a2"][1], [99 / 101, 99 / 101])
+
+
+def test_runtime_profiles_unsorted_targets():
+    pd_f1 = ProblemDescription("f1", "i1", 10, 2)
+    rs = ResultSet([Result("a1", pd_f1, HV_a1), Result("a2", pd_f1, HV_a2)])
+
+    profiles = runtime_profiles(rs, indicator="hypervolume", targets={pd_f1: [15, 25, 35, 120]})
+    shuffled = runtime_profiles(rs, indicator="hypervolume", targets={pd_f1: [120, 25, 15, 35]})
+
+    for algo in profiles:
+        np.testing.assert_array_equal(profiles[algo][0], shuffled[algo][0])
+        np.testing.assert_array_equal(profiles[algo][1], shuffled[algo][1])
+
+
+def test_rtpplot():
+    mpl = pytest.importorskip("matplotlib")
+    mpl.use("Agg")
+
+    pd_f1 = ProblemDescription("f1", "i1", 10, 2)
+    rs = ResultSet([Result("a1", pd_f1, HV_a1), Result("a2", pd_f1, HV_a2)])
+
+    ax = rtpplot(rs, "hypervolume")
+
+    assert [t.get_text() for t in ax.get_legend().get_texts()] == ["a1", "a2"]
+    assert ax.get_xscale() == "log"
+    assert ax.get_ylim() == (0, 100)
+
+
+def test_rtpplot_prop_cycle():
+    mpl = pytest.importorskip("matplotlib")
+    mpl.use("Agg")
+    import matplotlib.pyplot as plt
+    from cycler import cycler
+
+    pd_f1 = ProblemDescription("f1", "i1", 10, 2)
+    rs = ResultSet([Result("a1", pd_f1, HV_a1), Result("a2", pd_f1, HV_a2)])
+
+    # Colors come from the property cycle of the axes
+    _, ax = plt.subplots()
+    ax.set_prop_cycle(color=["red", "green"])
+    rtpplot(rs, "hypervolume", ax=ax)
+    (collection,) = ax.collections
+    np.testing.assert_array_equal(collection.get_colors(), mpl.colors.to_rgba_array(["red", "green"]))
+    assert len(ax.lines) == 0
+
+    # A property cycle without colors falls back to matplotlib's default line
+    # color, the other properties are still cycled
+    with mpl.rc_context({"axes.prop_cycle": cycler(linestyle=["-", "--"])}):
+        ax = rtpplot(rs, "hypervolume")
+    (collection,) = ax.collections
+    legend_lines = ax.get_legend().get_lines()
+    np.testing.assert_array_equal(
+        collection.get_colors(), mpl.colors.to_rgba_array([h.get_color() for h in legend_lines])
+    )
+    assert [h.get_linestyle() for h in legend_lines] == ["-", "--"]
+    plt.close("all")
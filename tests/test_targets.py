@@ -0,0 +1,64 @@
+import numpy as np
+
+from cocoviz.result import ProblemDescription, Result, ResultSet
+from cocoviz.targets import full_targets, linear_targets, log_targets
+
+
+HV_a1 = {
+    "fevals": [1, 2, 3, 10, 20, 50, 100],
+    "hypervolume": [10, 20, 30, 40, 50, 60, 70],
+    "r2": [20, 40, 60, 80, 100, 120, 140],
+}
+
+HV_a2 = {
+    "fevals": [1, 2, 3, 10, 20, 50, 100],
+    "hypervolume": [12, 22, 32, 42, 52, 62, 72],
+    "r2": [22, 42, 62, 82, 102, 122, 142],
+}
+
+pd_f1 = ProblemDescription("f1", "i1", 10, 2)
+pd_f2 = ProblemDescription("f2", "i1", 10, 2)
+
+RS = ResultSet([Result("a1", pd_f1, HV_a1), Result("a2", pd_f1, HV_a2), Result("a1", pd_f2, HV_a1)])
+
+
+def test_linear_targets():
+    targets = linear_targets(RS, "hypervolume", 3)
+    assert list(targets.keys()) == [pd_f1, pd_f2]
+    np.testing.assert_allclose(targets[pd_f1], [10, 41, 72])
+    np.testing.assert_allclose(targets[pd_f2], [10, 40, 70])
+
+    targets = linear_targets(RS, "r2", 3)
+    np.testing.assert_allclose(targets[pd_f1], [142, 81, 20])
+
+
+def test_log_targets():
+    targets = log_targets(RS, "hypervolume", 3)
+    np.testing.assert_allclose(targets[pd_f2], [10, 10 + 60e-8, 70])
+
+
+def test_full_targets():
+    targets = full_targets(RS, "hypervolume")
+    assert list(targets.keys()) == [pd_f1, pd_f2]
+    assert targets[pd_f1].to_list() == [10, 12, 20, 22, 30, 32, 40, 42, 50, 52, 60, 62, 70, 72]
+    assert targets[pd_f2].to_list() == [10, 20, 30, 40, 50, 60, 70]
+
+
+def test_empty_result_set():
+    assert linear_targets(ResultSet(), "hypervolume") == {}
+    assert full_targets(ResultSet(), "hypervolume") == {}
+
+
+def test_mixed_indicator_dtypes():
+    # Problems may store the same indicator with different data types
+    rs = ResultSet(
+        [
+            Result("a1", pd_f1, {"fevals": [1, 2, 3], "hypervolume": [10, 20, 30]}),
+            Result("a1", pd_f2, {"fevals": [1, 2, 3], "hypervolume": [1.0, 2.0, 3.0]}),
+        ]
+    )
+    np.testing.assert_allclose(linear_targets(rs, "hypervolume", 3)[pd_f1], [10, 20, 30])
+    np.testing.assert_allclose(linear_targets(rs, "hypervolume", 3)[pd_f2], [1.0, 2.0, 3.0])
+    assert log_targets(rs, "hypervolume", 3)[pd_f2][-1] == 3.0
+    assert full_targets(rs, "hypervolume")[pd_f1].to_list() == [10, 20, 30]
+    assert full_targets(rs, "hypervolume")[pd_f2].to_list() == [1.0, 2.0, 3.0]
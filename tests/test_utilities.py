@@ -0,0 +1,21 @@
+import numpy as np
+import pytest
+
+from cocoviz.utilities import scale_lightness, scale_lightness_array
+
+
+@pytest.mark.parametrize("scale_l", [0.5, 1.0, 1.5, 3.0])
+def test_scale_lightness_array(scale_l):
+    rng = np.random.default_rng(42)
+    colors = np.vstack([rng.random((100, 3)), [[0.0, 0.0, 0.0], [1.0, 1.0, 1.0], [0.5, 0.5, 0.5], [1.0, 0.0, 0.0]]])
+
+    expected = np.array([scale_lightness(c, scale_l) for c in colors])
+    np.testing.assert_allclose(scale_lightness_array(colors, scale_l), expected, rtol=0, atol=1e-15)
+
+
+def test_scale_lightness_array_broadcast():
+    colors = [[0.2, 0.4, 0.6], [0.9, 0.1, 0.3]]
+    scales = [0.5, 2.0]
+
+    expected = np.array([scale_lightness(c, s) for c, s in zip(colors, scales)])
+    np.testing.assert_allclose(scale_lightness_array(colors, scales), expected, rtol=0, atol=1e-15)